@@ -1,13 +1,35 @@
 #!/usr/bin/env python3
 import os
 import sys
-import subprocess
+import json
+import time
+import asyncio
+import concurrent.futures
+import random
+import hashlib
+import functools
 import configparser
 import gettext
 import glob
 
 import llm
 
+try:
+	import diskcache
+except ImportError:
+	diskcache = None
+
+try:
+	import polib
+except ImportError:
+	polib = None
+
+try:
+	from babel import Locale, UnknownLocaleError
+except ImportError:
+	Locale = None
+	UnknownLocaleError = ValueError
+
 
 DOC_TRANSLATION_PROMPT = """Please translate the following documentation.
 Do not include any extra commentary; output only the translated text.
@@ -18,37 +40,220 @@ Do not include any extra commentary; output only the translated text.
 Ensure the output preserves the names of the keys and conforms to the INI format without any sections.
 Do not translate the keys in the provided list of exclusions if they exist."""
 
-POT_TO_PO_PROMPT = """Please convert the following gettext POT file into a complete PO file for the specified language.
+POT_TO_PO_PROMPT = """Please convert the following gettext POT file into a complete PO file for the language specified after it.
 Retain the structure, comments, and msgid entries exactly as provided.
 For each translated entry, preserve its corresponding context and reference lines.
 For any msgid that does not have a translation provided, populate the msgstr.
-Ensure that the header is updated appropriately, including setting the "Language:" field to {language} and the Last-Translator field to {Last-Translator}.
+Ensure that the header is updated appropriately, including setting the "Language:" field to the specified language and the Last-Translator field to the specified Last-Translator.
 Output only the resulting PO file text with no additional commentary."""
 
+# separator the model is asked to emit between translations when several
+# languages are packed into a single prompt
+BATCH_SEPARATOR = "%%---%%"
+
+CACHE_DIR = ".autotranslate-cache"
+
+# transient provider errors (429s, 5xx, timeouts) are retried this many times
+# with exponential backoff and jitter before a prompt is declared failed
+RETRY_ATTEMPTS = 5
+
+PROTECTED_MANIFEST_KEYS = {
+	"name",
+	"author",
+	"url",
+	"version",
+	"docFileName",
+	"minimumNVDAVersion",
+	"lastTestedNVDAVersion",
+	"updateChannel",
+}  # never alter these keys" values
+
+
+# Prompts place the static instructions and source content first and splice the
+# language in at the very end, so all language calls for one file share a long
+# byte-identical prefix. Providers with automatic prompt/KV caching (OpenAI,
+# Anthropic, llama.cpp) then only pay prefill cost for that prefix once.
+
+
+def doc_prompt_prefix(content):
+	"""Build the static (per-run) part of the documentation prompt."""
+	return f"{DOC_TRANSLATION_PROMPT}\n\n{content}\n\n"
+
+
+def manifest_prompt_prefix(manifest_ini):
+	"""Build the static (per-run) part of the manifest prompt."""
+	return f"{MANIFEST_TRANSLATION_PROMPT}\nexclusions: {', '.join(sorted(PROTECTED_MANIFEST_KEYS))}\n\n{manifest_ini}\n\n"
+
+
+def messages_prompt_prefix(pot_content):
+	"""Build the static (per-run) part of the POT-to-PO prompt."""
+	return f"{POT_TO_PO_PROMPT}\n\n{pot_content}\n\n"
+
+
+def build_doc_prompt(content, lang):
+	"""Build the prompt translating the readme into a single language."""
+	return doc_prompt_prefix(content) + f"Translate the above to language: {lang}"
+
+
+def build_manifest_prompt(manifest_ini, lang):
+	"""Build the prompt translating manifest.ini into a single language."""
+	return manifest_prompt_prefix(manifest_ini) + f"Language: {lang}"
+
+
+def build_messages_prompt(author, pot_content, lang):
+	"""Build the prompt converting the POT file into a PO file for a single language."""
+	return messages_prompt_prefix(pot_content) + f"Language: {lang}\nLast-Translator: {author}"
+
+
+_sync_executor = None
+
+
+def _get_sync_executor(max_workers=10):
+	"""Return the shared thread pool used to drive sync-only llm plugins.
+
+	Created lazily with the size of the first request; the in-flight
+	semaphore enforces the effective concurrency cap either way.
+	"""
+	global _sync_executor
+	if _sync_executor is None:
+		_sync_executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+	return _sync_executor
+
+
+def get_cache(enabled=True):
+	"""Open the persistent translation cache, or return None when unavailable.
+
+	The cache maps sha256(model_id + prompt) to the model's translation, so
+	re-running the tool after editing one file only pays for the prompts
+	whose source text actually changed. Requires the diskcache package;
+	without it the tool simply translates everything every run.
+	"""
+	if not enabled:
+		return None
+	if diskcache is None:
+		print("Warning: the diskcache package is not installed; the translation cache is disabled.")
+		return None
+	return diskcache.Cache(CACHE_DIR)
+
+
+def cache_key(model_id, text):
+	"""Compute the cache key for a prompt against a specific model."""
+	return hashlib.sha256((model_id + "\0" + text).encode("utf-8")).hexdigest()
+
+
+class RateLimiter:
+	"""Token bucket limiting the number of requests issued per minute.
+
+	One instance is shared by every translation coroutine in a run so the
+	process as a whole stays under the provider's QPM ceiling. Tokens refill
+	continuously based on elapsed time; acquire() sleeps until one is
+	available. A qpm of 0 disables limiting.
+	"""
+
+	def __init__(self, qpm):
+		self.qpm = qpm
+		self._tokens = float(qpm)
+		self._updated = time.monotonic()
+		self._lock = asyncio.Lock()
+
+	async def acquire(self):
+		if not self.qpm:
+			return
+		async with self._lock:
+			while True:
+				now = time.monotonic()
+				self._tokens = min(float(self.qpm), self._tokens + (now - self._updated) * (self.qpm / 60.0))
+				self._updated = now
+				if self._tokens >= 1:
+					self._tokens -= 1
+					return
+				await asyncio.sleep((1 - self._tokens) / (self.qpm / 60.0))
+
+
+def _is_up_to_date(out_file, src_mtime):
+	"""Return True when out_file exists and is at least as new as its source."""
+	return os.path.exists(out_file) and os.path.getmtime(out_file) >= src_mtime
+
+
+def _filter_stale(languages, src_path, out_file_for):
+	"""Drop languages whose output file is newer than the source, announcing each skip.
+
+	out_file_for maps a language code to its output path. Returns the
+	languages that still need translating.
+	"""
+	src_mtime = os.path.getmtime(src_path)
+	remaining = []
+	for lang in languages:
+		out_file = out_file_for(lang)
+		if _is_up_to_date(out_file, src_mtime):
+			print(f"Skipping {out_file} (up to date)")
+		else:
+			remaining.append(lang)
+	return remaining
+
+
+def _prepare_dirs(addon_dir, languages):
+	"""Create every output directory up front, before any LLM call starts.
+
+	Cheaper than calling os.makedirs per language inside each translate
+	loop, and avoids concurrent coroutines racing to create the same paths.
+	"""
+	dirs = set()
+	for lang in languages:
+		dirs.add(os.path.join(addon_dir, "doc", lang))
+		dirs.add(os.path.join(addon_dir, "locale", lang, "LC_MESSAGES"))
+	for d in dirs:
+		os.makedirs(d, exist_ok=True)
+
 
 def get_author_info_from_git():
 	"""Get stored Git user name and email.
 
+	Reads .git/config and ~/.gitconfig directly instead of shelling out to
+	`git config`, which avoids two subprocess spawns per run and works even
+	when git itself is not installed.
+
 	Returns:
 		tuple: (name, email) from git configuration.
 	"""
+	config = configparser.ConfigParser(strict=False)
 	try:
-		name = subprocess.check_output("git config user.name").decode()
-		email = subprocess.check_output("git config user.email").decode()
-	except (FileNotFoundError, subprocess.CalledProcessError):
+		config.read([os.path.expanduser("~/.gitconfig"), os.path.join(".git", "config")])
+	except configparser.Error:
+		name = email = None
+	else:
+		name = config.get("user", "name", fallback=None)
+		email = config.get("user", "email", fallback=None)
+	if not name or not email:
 		print(
-			f"Error obtaining author information from git. Either git is not installed, or the user.name and user.email configuration options have not been defined."
+			f"Error obtaining author information from git. The user.name and user.email configuration options have not been defined."
 		)
 		sys.exit(1)
 	return name.strip(), email.strip()
 
 
+@functools.lru_cache(maxsize=8)
 def get_llm(name):
 	"""Get the LLM model instance.
-	Name can be partial, like GPT-4o."""
+	Name can be partial, like GPT-4o.
+
+	Memoized: llm.get_model scans installed plugins, so library callers
+	invoking run() in a loop over many add-ons resolve each model once.
+	"""
 	return llm.get_model(name)
 
 
+@functools.lru_cache(maxsize=8)
+def get_async_llm(name):
+	"""Get the async LLM model instance.
+	Name can be partial, like GPT-4o.
+
+	Memoized like `get_llm`. Sharing one async model handle across
+	coroutines is fine; prompt state lives in the per-call response objects.
+	"""
+	return llm.get_async_model(name)
+
+
 def prompt_ai(model, text, fenced=True):
 	"""Prompt the AI model with the given text.
 
@@ -70,68 +275,455 @@ def prompt_ai(model, text, fenced=True):
 	return response
 
 
-def validate_languages(languages):
-	"""Validate and process a list of languages (either str or sequence), returning the processed language codes."""
+async def _stream_response(model, text):
+	"""Send a prompt and consume the response as a stream of chunks.
+
+	Streaming overlaps network receive with local accumulation and avoids
+	holding a second full copy of the response inside the client while it
+	finishes, which matters for PO responses that can run to hundreds of
+	kilobytes.
+
+	Accepts sync models too: their responses do not support async
+	iteration, so they are resolved on a thread pool instead. The call is
+	network-bound and releases the GIL while waiting, making threads an
+	adequate substitute when a plugin has no async implementation.
+	"""
+	response = model.prompt(text)
+	if hasattr(response, "__aiter__"):
+		chunks = []
+		async for chunk in response:
+			chunks.append(chunk)
+		return "".join(chunks)
+	loop = asyncio.get_running_loop()
+	return await loop.run_in_executor(_get_sync_executor(), response.text)
+
+
+async def prompt_ai_async(model, text, fenced=True, semaphore=None, limiter=None, cache=None):
+	"""Prompt the AI model with the given text, without blocking the event loop.
+
+	Args:
+		model: The async language model instance. Call `get_async_llm()` to get this.
+		text (str): The prompt text to send to the model.
+		fenced (bool): Whether to extract a fenced code block from the response.
+		semaphore (asyncio.Semaphore): Optional cap on the number of in-flight requests.
+		limiter (RateLimiter): Optional requests-per-minute limiter shared across the run.
+		cache (diskcache.Cache): Optional persistent cache of earlier responses.
+
+	Returns:
+		str: The response from the AI model.
+	"""
+	if cache is not None:
+		key = cache_key(model.model_id, text)
+		cached = cache.get(key)
+		if cached is not None:
+			return cached
+
+	async def attempt_prompt():
+		if semaphore is not None:
+			async with semaphore:
+				if limiter is not None:
+					await limiter.acquire()
+				return await _stream_response(model, text)
+		if limiter is not None:
+			await limiter.acquire()
+		return await _stream_response(model, text)
+
+	for attempt in range(RETRY_ATTEMPTS):
+		try:
+			response = await attempt_prompt()
+			break
+		except Exception as e:
+			if attempt == RETRY_ATTEMPTS - 1:
+				raise
+			delay = min(30.0, 2 ** attempt) + random.uniform(0, 1)
+			print(f"Warning: request failed ({e}). Retrying in {delay:.1f} seconds...")
+			await asyncio.sleep(delay)
+	if fenced:
+		cb = llm.utils.extract_fenced_code_block(response)
+		if cb:
+			response = cb
+		else:
+			print(f"Warning: failed to extract fenced code block. Continuing...")
+	if cache is not None:
+		cache.set(key, response)
+	return response
+
+
+async def prompt_languages(model, build_prompt, languages, batch_size, fenced=True, semaphore=None, limiter=None, cache=None):
+	"""Request a translation for every language, packing up to batch_size languages into each prompt.
+
+	Since the source text is identical across languages, combining several of
+	them into one request amortizes the fixed per-call overhead. The model is
+	asked to separate the translations with BATCH_SEPARATOR; any batch whose
+	response does not split into exactly len(batch) parts is retried one
+	language at a time.
+
+	Args:
+		model: The async language model instance.
+		build_prompt: Callable receiving a list of language codes and returning the prompt text.
+		languages (list): Language codes to translate into.
+		batch_size (int): Maximum number of languages per request.
+		fenced, semaphore, limiter, cache: Passed through to `prompt_ai_async`.
+
+	Returns:
+		dict: Maps each language to its translation, or to the exception that caused it to fail.
+	"""
+	batch_size = max(1, batch_size)
+	groups = [languages[i:i + batch_size] for i in range(0, len(languages), batch_size)]
+	tasks = [
+		prompt_ai_async(model, build_prompt(group), fenced=fenced, semaphore=semaphore, limiter=limiter, cache=cache)
+		for group in groups
+	]
+	responses = await asyncio.gather(*tasks, return_exceptions=True)
+	results = {}
+	retry_langs = []
+	for group, response in zip(groups, responses):
+		if isinstance(response, Exception):
+			for lang in group:
+				results[lang] = response
+			continue
+		if len(group) == 1:
+			results[group[0]] = response
+			continue
+		parts = [part.strip("\n") for part in response.split(BATCH_SEPARATOR)]
+		if len(parts) == len(group):
+			results.update(zip(group, parts))
+		else:
+			print(
+				f"Warning: expected {len(group)} translations but got {len(parts)}; retrying {', '.join(group)} individually."
+			)
+			retry_langs.extend(group)
+	if retry_langs:
+		tasks = [
+			prompt_ai_async(model, build_prompt([lang]), fenced=fenced, semaphore=semaphore, limiter=limiter, cache=cache)
+			for lang in retry_langs
+		]
+		responses = await asyncio.gather(*tasks, return_exceptions=True)
+		results.update(zip(retry_langs, responses))
+	return results
+
+
+def validate_languages(languages, strict=False):
+	"""Validate a list of language codes, returning the base language code for each.
+
+	Uses babel's locale data when available, falling back to gettext
+	normalization otherwise. Unknown codes print a warning and are kept
+	as-is (the default) or abort the run (strict=True). Validation never
+	prompts interactively, so the tool can run unattended in CI.
+	"""
 	newlangs = []
 	for lang in languages:
-		lang = gettext._expand_lang(lang)
-		if len(lang) < 2:
+		base = None
+		if Locale is not None:
+			try:
+				base = Locale.parse(lang.replace("-", "_")).language
+			except (ValueError, UnknownLocaleError):
+				base = None
+		else:
+			expanded = gettext._expand_lang(lang)
+			if len(expanded) >= 2:
+				base = expanded[1]
+		if base is None:
 			print(f"Warning: Unrecognized language: {lang}.")
-			if not input("Would you like to continue? (y/n)").lower().startswith("y"):
+			if strict:
 				sys.exit(1)
-		newlangs.append(lang[1])
+			base = lang
+		newlangs.append(base)
 	return newlangs
 
 
-def translate_docs(readme_path, addon_dir, model, languages):
+async def translate_docs(readme_path, addon_dir, model, languages, semaphore=None, limiter=None, batch_languages=4, cache=None, force=False):
+	if not force:
+		languages = _filter_stale(
+			languages, readme_path, lambda lang: os.path.join(addon_dir, "doc", lang, "readme.md")
+		)
+	if not languages:
+		return []
 	with open(readme_path, "r", encoding="utf-8") as f:
 		content = f.read()
+
+	prefix = doc_prompt_prefix(content)
+
+	def build_prompt(langs):
+		if len(langs) == 1:
+			return prefix + f"Translate the above to language: {langs[0]}"
+		return (
+			prefix
+			+ f"Translate the above into each of the following languages in order, separating the translations with a line containing only '{BATCH_SEPARATOR}':\n"
+			+ "\n".join(langs)
+		)
+
+	results = await prompt_languages(
+		model, build_prompt, languages, batch_languages, fenced=True, semaphore=semaphore, limiter=limiter, cache=cache
+	)
+	failed = []
 	for lang in languages:
-		prompt_text = f"{DOC_TRANSLATION_PROMPT}\nLanguage: {lang}\n\n{content}"
-		translated = prompt_ai(model, prompt_text, fenced=True)
-		output_dir = os.path.join(addon_dir, "doc", lang)
-		os.makedirs(output_dir, exist_ok=True)
-		out_file = os.path.join(output_dir, "readme.md")
+		translated = results[lang]
+		if isinstance(translated, Exception):
+			print(f"Warning: failed to translate documentation to {lang}: {translated}")
+			failed.append(lang)
+			continue
+		out_file = os.path.join(addon_dir, "doc", lang, "readme.md")
 		with open(out_file, "w", encoding="utf-8") as outf:
 			outf.write(translated)
 		print(f"Wrote {len(translated)} characters to {out_file}")
+	return failed
 
 
-def translate_manifests(addon_dir, model, languages):
-	protected_keys = {
-		"name",
-		"author",
-		"url",
-		"version",
-		"docFileName",
-		"minimumNVDAVersion",
-		"lastTestedNVDAVersion",
-		"updateChannel",
-	}  # never alter these keys" values
+async def translate_manifests(addon_dir, model, languages, semaphore=None, limiter=None, batch_languages=4, cache=None, force=False):
+	if not force:
+		languages = _filter_stale(
+			languages,
+			os.path.join(addon_dir, "manifest.ini"),
+			lambda lang: os.path.join(addon_dir, "locale", lang, "manifest.ini"),
+		)
+	if not languages:
+		return []
 	with open(os.path.join(addon_dir, "manifest.ini"), "r", encoding="utf-8") as f:
 		manifest_ini = f.read()
+
+	prefix = manifest_prompt_prefix(manifest_ini)
+
+	def build_prompt(langs):
+		if len(langs) == 1:
+			return prefix + f"Language: {langs[0]}"
+		return (
+			prefix
+			+ f"Translate the above into each of the following languages in order, separating the translations with a line containing only '{BATCH_SEPARATOR}':\n"
+			+ "\n".join(langs)
+		)
+
+	results = await prompt_languages(
+		model, build_prompt, languages, batch_languages, fenced=False, semaphore=semaphore, limiter=limiter, cache=cache
+	)
+	failed = []
 	for lang in languages:
-		manifest_dir = os.path.join(addon_dir, "locale", lang)
-		manifest_file = os.path.join(manifest_dir, "manifest.ini")
-		os.makedirs(manifest_dir, exist_ok=True)
-		prompt_text = f"{MANIFEST_TRANSLATION_PROMPT}\nLanguage: {lang}\nexclusions: {', '.join(protected_keys)}\n\n{manifest_ini}"
-		translated_manifest = prompt_ai(model, prompt_text, fenced=False)
+		translated_manifest = results[lang]
+		if isinstance(translated_manifest, Exception):
+			print(f"Warning: failed to translate manifest to {lang}: {translated_manifest}")
+			failed.append(lang)
+			continue
+		manifest_file = os.path.join(addon_dir, "locale", lang, "manifest.ini")
 		with open(manifest_file, "w", encoding="utf-8") as f:
 			f.write(translated_manifest)
 		print(f"Wrote {len(translated_manifest)} characters to {manifest_file}")
+	return failed
+
+
+def _pot_chunk_text(pot, entries):
+	"""Render a minimal POT holding only the given entries, keeping the original header."""
+	chunk = polib.POFile()
+	chunk.metadata = dict(pot.metadata)
+	for entry in entries:
+		chunk.append(entry)
+	return str(chunk)
+
+
+def _parse_po(text):
+	"""Parse model output as a PO file, tolerating a fenced code block wrapper. Returns None on failure."""
+	candidates = [text]
+	cb = llm.utils.extract_fenced_code_block(text)
+	if cb:
+		candidates.append(cb)
+	for candidate in candidates:
+		try:
+			return polib.pofile(candidate)
+		except Exception:
+			continue
+	return None
 
 
-def translate_messages(author, addon_dir, pot_file, model, languages):
+async def _translate_po_chunk(model, prompt_text, lang, semaphore=None, limiter=None, cache=None):
+	"""Translate one POT chunk into a parsed PO for a single language.
+
+	Takes the fully built prompt so callers can share one prefix per chunk
+	across all languages. The response is validated with polib before being
+	accepted (or cached); an unparseable response is retried once, bypassing
+	the cache.
+	"""
+	if cache is not None:
+		key = cache_key(model.model_id, prompt_text)
+		cached = cache.get(key)
+		if cached is not None:
+			return polib.pofile(cached)
+	for attempt in range(2):
+		response = await prompt_ai_async(model, prompt_text, fenced=False, semaphore=semaphore, limiter=limiter)
+		po = _parse_po(response)
+		if po is not None:
+			if cache is not None:
+				cache.set(key, str(po))
+			return po
+		if attempt == 0:
+			print(f"Warning: could not parse the translated PO chunk for {lang}. Retrying...")
+	raise ValueError(f"the model returned an unparseable PO chunk for {lang}")
+
+
+async def translate_messages(author, addon_dir, pot_file, model, languages, semaphore=None, limiter=None, batch_languages=4, cache=None, pot_chunk_size=50, force=False):
+	if not force:
+		languages = _filter_stale(
+			languages,
+			pot_file,
+			lambda lang: os.path.join(addon_dir, "locale", lang, "LC_MESSAGES", "nvda.po"),
+		)
+	if not languages:
+		return []
+	if polib is None:
+		print("Warning: the polib package is not installed; sending the whole POT file in one prompt per language.")
+		return await _translate_messages_whole(
+			author, addon_dir, pot_file, model, languages,
+			semaphore=semaphore, limiter=limiter, batch_languages=batch_languages, cache=cache,
+		)
+	pot = polib.pofile(pot_file)
+	entries = [entry for entry in pot if entry.msgid]
+	pot_chunk_size = max(1, pot_chunk_size)
+	chunk_texts = [
+		_pot_chunk_text(pot, entries[i:i + pot_chunk_size])
+		for i in range(0, len(entries), pot_chunk_size)
+	]
+	chunk_prefixes = [messages_prompt_prefix(chunk_text) for chunk_text in chunk_texts]
+	tasks = {}
+	for lang in languages:
+		for index, chunk_prefix in enumerate(chunk_prefixes):
+			prompt_text = chunk_prefix + f"Language: {lang}\nLast-Translator: {author}"
+			tasks[(lang, index)] = _translate_po_chunk(
+				model, prompt_text, lang, semaphore=semaphore, limiter=limiter, cache=cache
+			)
+	results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+	results = dict(zip(tasks.keys(), results))
+	failed = []
+	for lang in languages:
+		parts = [results[(lang, index)] for index in range(len(chunk_texts))]
+		errors = [part for part in parts if isinstance(part, Exception)]
+		if errors:
+			print(f"Warning: failed to translate messages to {lang}: {errors[0]}")
+			failed.append(lang)
+			continue
+		po = polib.POFile()
+		po.metadata = dict(pot.metadata)
+		po.metadata["Language"] = lang
+		po.metadata["Last-Translator"] = author
+		for part in parts:
+			for entry in part:
+				po.append(entry)
+		po_file = os.path.join(addon_dir, "locale", lang, "LC_MESSAGES", "nvda.po")
+		po.save(po_file)
+		print(f"Wrote {len(po)} translated entries to {po_file}")
+	return failed
+
+
+async def _translate_messages_whole(author, addon_dir, pot_file, model, languages, semaphore=None, limiter=None, batch_languages=4, cache=None):
+	"""Fallback used without polib: convert the entire POT in a single prompt per language batch."""
 	with open(pot_file, "r", encoding="utf-8") as f:
 		pot_content = f.read()
+
+	prefix = messages_prompt_prefix(pot_content)
+
+	def build_prompt(langs):
+		if len(langs) == 1:
+			return prefix + f"Language: {langs[0]}\nLast-Translator: {author}"
+		return (
+			prefix
+			+ f"Produce one complete PO file per language, in the order listed below, separated by a line containing only '{BATCH_SEPARATOR}':\n"
+			+ "\n".join(langs)
+			+ f"\nLast-Translator: {author}"
+		)
+
+	# PO prompts are large, so cap the batch at two languages to stay clear of the context window
+	results = await prompt_languages(
+		model, build_prompt, languages, min(2, batch_languages), fenced=True, semaphore=semaphore, limiter=limiter, cache=cache
+	)
+	failed = []
 	for lang in languages:
+		translated_po = results[lang]
+		if isinstance(translated_po, Exception):
+			print(f"Warning: failed to translate messages to {lang}: {translated_po}")
+			failed.append(lang)
+			continue
 		po_file = os.path.join(addon_dir, "locale", lang, "LC_MESSAGES", "nvda.po")
-		os.makedirs(os.path.dirname(po_file), exist_ok=True)
-		prompt_text = f"{POT_TO_PO_PROMPT.replace('{language}', lang).replace('{Last-Translator}', author)}\n\n{pot_content}"
-		translated_po = prompt_ai(model, prompt_text, fenced=True)
 		with open(po_file, "w", encoding="utf-8") as f:
 			f.write(translated_po)
 		print(f"Wrote {len(translated_po)} characters to {po_file}")
+	return failed
+
+
+def run_batch_api(addon_dir, readme_path, pot_file, author, languages, model_name, poll_interval=60):
+	"""Translate everything through the OpenAI Batch API instead of live prompting.
+
+	Builds one /v1/chat/completions request per (kind, language) pair, uploads
+	them as a single JSONL batch job, polls until the job finishes, and routes
+	each response back to the file the live path would have written. Batch
+	jobs cost roughly half the synchronous price but may take up to 24 hours,
+	which suits CI or nightly translation runs.
+	"""
+	try:
+		from openai import OpenAI
+	except ImportError:
+		print("Error: the --batch-api option requires the openai package. Install it with `pip install openai`.")
+		sys.exit(1)
+	if model_name is None:
+		model_name = "gpt-4o-mini"
+	with open(readme_path, "r", encoding="utf-8") as f:
+		content = f.read()
+	with open(os.path.join(addon_dir, "manifest.ini"), "r", encoding="utf-8") as f:
+		manifest_ini = f.read()
+	with open(pot_file, "r", encoding="utf-8") as f:
+		pot_content = f.read()
+	_prepare_dirs(addon_dir, languages)
+	requests = []
+	for lang in languages:
+		prompts = {
+			"doc": build_doc_prompt(content, lang),
+			"manifest": build_manifest_prompt(manifest_ini, lang),
+			"messages": build_messages_prompt(author, pot_content, lang),
+		}
+		for kind, prompt in prompts.items():
+			requests.append({
+				"custom_id": f"{kind}:{lang}",
+				"method": "POST",
+				"url": "/v1/chat/completions",
+				"body": {
+					"model": model_name,
+					"messages": [{"role": "user", "content": prompt}],
+				},
+			})
+	payload = "\n".join(json.dumps(request) for request in requests).encode("utf-8")
+	client = OpenAI()
+	batch_input = client.files.create(file=("autotranslate.jsonl", payload), purpose="batch")
+	batch = client.batches.create(
+		input_file_id=batch_input.id,
+		endpoint="/v1/chat/completions",
+		completion_window="24h",
+	)
+	print(f"Submitted batch {batch.id} with {len(requests)} requests. Polling for completion...")
+	while batch.status in ("validating", "in_progress", "finalizing"):
+		time.sleep(poll_interval)
+		batch = client.batches.retrieve(batch.id)
+	if batch.status != "completed":
+		print(f"Error: batch {batch.id} finished with status {batch.status}.")
+		sys.exit(1)
+	output = client.files.content(batch.output_file_id).text
+	for line in output.splitlines():
+		if not line.strip():
+			continue
+		item = json.loads(line)
+		kind, lang = item["custom_id"].split(":", 1)
+		if item.get("error") or item["response"]["status_code"] != 200:
+			print(f"Warning: batch request {item['custom_id']} failed: {item.get('error')}")
+			continue
+		translated = item["response"]["body"]["choices"][0]["message"]["content"]
+		if kind in ("doc", "messages"):
+			cb = llm.utils.extract_fenced_code_block(translated)
+			if cb:
+				translated = cb
+		if kind == "doc":
+			out_file = os.path.join(addon_dir, "doc", lang, "readme.md")
+		elif kind == "manifest":
+			out_file = os.path.join(addon_dir, "locale", lang, "manifest.ini")
+		else:
+			out_file = os.path.join(addon_dir, "locale", lang, "LC_MESSAGES", "nvda.po")
+		with open(out_file, "w", encoding="utf-8") as f:
+			f.write(translated)
+		print(f"Wrote {len(translated)} characters to {out_file}")
 
 
 def parse_args():
@@ -170,10 +762,59 @@ def parse_args():
 		help="The full or short name of the large language model to use, e.g. 4o for GPT-4O. Defaults to the one used by the llm tool.",
 		default=None,
 	)
+	parser.add_argument(
+		"--max-concurrency",
+		type=int,
+		default=10,
+		help="Maximum number of simultaneous requests to the model provider.",
+	)
+	parser.add_argument(
+		"--qpm",
+		type=int,
+		default=500,
+		help="Maximum number of requests per minute across the whole run. 0 disables the limit.",
+	)
+	parser.add_argument(
+		"--batch-languages",
+		type=int,
+		default=4,
+		help="Number of languages to combine into a single prompt. 1 sends one request per language.",
+	)
+	parser.add_argument(
+		"--batch-api",
+		action="store_true",
+		help="Submit everything as an OpenAI Batch API job (about half the cost, up to 24h turnaround). Requires the openai package.",
+	)
+	parser.add_argument(
+		"--pot-chunk-size",
+		type=int,
+		default=50,
+		help="Number of POT entries to translate per request. Requires the polib package.",
+	)
+	parser.add_argument(
+		"--force",
+		action="store_true",
+		help="Regenerate every output file even when it is newer than its source.",
+	)
+	parser.add_argument(
+		"--strict",
+		action="store_true",
+		help="Abort when a language code is not recognized, instead of warning and continuing.",
+	)
+	parser.add_argument(
+		"--no-cache",
+		action="store_true",
+		help="Do not read or write the persistent translation cache.",
+	)
+	parser.add_argument(
+		"--clear-cache",
+		action="store_true",
+		help="Empty the persistent translation cache before running.",
+	)
 	return parser.parse_args()
 
 
-def run(
+async def run_async(
 	addon_dir,
 	languages,
 	readme="readme.md",
@@ -181,6 +822,14 @@ def run(
 	author_name=None,
 	author_email=None,
 	model_name=None,
+	max_concurrency=10,
+	qpm=500,
+	batch_languages=4,
+	batch_api=False,
+	use_cache=True,
+	pot_chunk_size=50,
+	strict=False,
+	force=False,
 ):
 	if author_name is None or author_email is None:
 		git_name, git_email = get_author_info_from_git()
@@ -215,25 +864,63 @@ def run(
 	if not os.path.isfile(readme):
 		raise FileNotFoundError(f"Error: The readme file {readme} does not exist.")
 	langs = languages if isinstance(languages, list) else languages.split()
-	pretty_langs = validate_languages(langs)
-	model = get_llm(model_name)
+	pretty_langs = validate_languages(langs, strict=strict)
+	if batch_api:
+		print(f"Translating {addon_name} to language(s): {', '.join(pretty_langs)} via the batch API")
+		run_batch_api(addon_dir, readme, pot_file, author, langs, model_name)
+		return
+	try:
+		model = get_async_llm(model_name)
+	except llm.UnknownModelError:
+		# sync-only plugin (local llama.cpp, some ollama bridges); prompts run
+		# on a thread pool instead so run_async keeps its single asyncio model
+		model = get_llm(model_name)
+		_get_sync_executor(max_concurrency)
+		print(f"Note: {model.model_id} has no async implementation; prompting from a thread pool instead.")
 	print(f"Translating {addon_name} to language(s): {', '.join(pretty_langs)} using {model.model_id}")
-	print("Documentation...")
-	translate_docs(readme, addon_dir, model, langs)
-	print("Manifests...")
-	translate_manifests(addon_dir, model, langs)
-	print("Messages...")
-	translate_messages(author, addon_dir, pot_file, model, langs)
+	print("Translating documentation, manifests and messages...")
+	_prepare_dirs(addon_dir, langs)
+	semaphore = asyncio.Semaphore(max_concurrency)
+	limiter = RateLimiter(qpm)
+	cache = get_cache(use_cache)
+	failures = await asyncio.gather(
+		translate_docs(readme, addon_dir, model, langs, semaphore=semaphore, limiter=limiter, batch_languages=batch_languages, cache=cache, force=force),
+		translate_manifests(addon_dir, model, langs, semaphore=semaphore, limiter=limiter, batch_languages=batch_languages, cache=cache, force=force),
+		translate_messages(author, addon_dir, pot_file, model, langs, semaphore=semaphore, limiter=limiter, batch_languages=batch_languages, cache=cache, pot_chunk_size=pot_chunk_size, force=force),
+	)
+	failed_langs = sorted(set(failures[0]) | set(failures[1]) | set(failures[2]))
+	if failed_langs:
+		print(f"Finished with errors. The following language(s) did not fully translate: {', '.join(failed_langs)}")
+	else:
+		print("Done.")
+
+
+def run(*args, **kwargs):
+	"""Synchronous entry point for library use. Accepts the same arguments as `run_async`."""
+	asyncio.run(run_async(*args, **kwargs))
 
 
 if __name__ == "__main__":
 	args = parse_args()
-	run(
-		args.input,
-		args.languages,
-		args.readme,
-		pot_file=args.pot,
-		author_name=args.author_name,
-		author_email=args.author_email,
-		model_name=args.model,
+	if args.clear_cache and diskcache is not None:
+		diskcache.Cache(CACHE_DIR).clear()
+		print("Cleared the translation cache.")
+	asyncio.run(
+		run_async(
+			args.input,
+			args.languages,
+			args.readme,
+			pot_file=args.pot,
+			author_name=args.author_name,
+			author_email=args.author_email,
+			model_name=args.model,
+			max_concurrency=args.max_concurrency,
+			qpm=args.qpm,
+			batch_languages=args.batch_languages,
+			batch_api=args.batch_api,
+			use_cache=not args.no_cache,
+			pot_chunk_size=args.pot_chunk_size,
+			strict=args.strict,
+			force=args.force,
+		)
 	)